@@ -1,6 +1,7 @@
 from diagnostics_framework.registry import register_system, register_test, register_plot, register_report, registry
 from diagnostics_framework.models import DiagnosticResult, DiagnosticStatus, DiagnosticSummary
 from diagnostics_framework.runner import run_diagnostics, generate_plot, generate_report
+from diagnostics_framework.cache import cache_scope
 
-# Auto-discover and register all system plugins
-import diagnostics_framework.systems  # noqa: F401
+# System plugins are discovered by module name and imported on first use
+from diagnostics_framework.systems import load_system, load_all_systems
@@ -4,27 +4,44 @@ import json
 import pandas as pd
 import streamlit as st
 
-# Import systems to trigger decorator registration
-import diagnostics_framework.systems  # noqa: F401
-
-from diagnostics_framework.models import DiagnosticStatus
+from diagnostics_framework.cache import cache_scope
+from diagnostics_framework.models import DiagnosticStatus, DiagnosticSummary
 from diagnostics_framework.registry import registry
 from diagnostics_framework.runner import run_diagnostics, generate_plot, generate_report
+from diagnostics_framework.systems import load_all_systems
 
 
-STATUS_COLORS = {
-    DiagnosticStatus.PASS: "#28a745",
-    DiagnosticStatus.FAIL: "#dc3545",
-    DiagnosticStatus.WARNING: "#ffc107",
-    DiagnosticStatus.ERROR: "#6c757d",
+# (color, icon) per status, so rendering a result costs a single lookup.
+STATUS_STYLES = {
+    DiagnosticStatus.PASS: ("#28a745", "PASS"),
+    DiagnosticStatus.FAIL: ("#dc3545", "FAIL"),
+    DiagnosticStatus.WARNING: ("#ffc107", "WARN"),
+    DiagnosticStatus.ERROR: ("#6c757d", "ERR"),
 }
 
-STATUS_ICONS = {
-    DiagnosticStatus.PASS: "PASS",
-    DiagnosticStatus.FAIL: "FAIL",
-    DiagnosticStatus.WARNING: "WARN",
-    DiagnosticStatus.ERROR: "ERR",
-}
+
+@st.cache_data(show_spinner=False)
+def _parse_upload(name: str, content: bytes) -> pd.DataFrame | dict | list | str:
+    """Parse uploaded bytes by file extension. Cached on content, so reruns skip re-parsing."""
+    buffer = io.BytesIO(content)
+    if name.endswith(".csv"):
+        # pyarrow (a Streamlit dependency) parses in parallel blocks; fall back for files it rejects.
+        try:
+            return pd.read_csv(buffer, engine="pyarrow")
+        except (ImportError, ValueError):
+            buffer.seek(0)
+            return pd.read_csv(buffer)
+    elif name.endswith(".json"):
+        parsed = json.load(buffer)
+        if isinstance(parsed, list) and all(isinstance(r, dict) for r in parsed):
+            return pd.DataFrame(parsed)
+        return parsed
+    elif name.endswith((".xls", ".xlsx")):
+        return pd.read_excel(buffer)
+    elif name.endswith(".parquet"):
+        return pd.read_parquet(buffer)
+    else:
+        return content.decode("utf-8", errors="replace")
 
 
 def load_data(uploaded_file) -> pd.DataFrame | dict | None:
@@ -32,26 +49,22 @@ def load_data(uploaded_file) -> pd.DataFrame | dict | None:
     if uploaded_file is None:
         return None
 
-    name = uploaded_file.name.lower()
     try:
-        if name.endswith(".csv"):
-            return pd.read_csv(uploaded_file)
-        elif name.endswith(".json"):
-            content = json.load(uploaded_file)
-            if isinstance(content, list) and all(isinstance(r, dict) for r in content):
-                return pd.DataFrame(content)
-            return content
-        elif name.endswith((".xls", ".xlsx")):
-            return pd.read_excel(uploaded_file)
-        elif name.endswith(".parquet"):
-            return pd.read_parquet(io.BytesIO(uploaded_file.read()))
-        else:
-            return uploaded_file.read().decode("utf-8", errors="replace")
+        return _parse_upload(uploaded_file.name.lower(), uploaded_file.getvalue())
     except Exception as e:
         st.error(f"Failed to load file: {e}")
         return None
 
 
+def cached_run_diagnostics(system_name: str, upload_id: str, data) -> DiagnosticSummary:
+    """Run diagnostics once per (system, uploaded file) in this session instead of on every click."""
+    key = (system_name, upload_id)
+    cached = st.session_state.get("diagnostics_cache")
+    if cached is None or cached[0] != key:
+        cached = st.session_state["diagnostics_cache"] = (key, run_diagnostics(system_name, data))
+    return cached[1]
+
+
 def render_results(summary):
     """Render diagnostic results as a styled table."""
     st.subheader("Diagnostic Results")
@@ -62,20 +75,22 @@ def render_results(summary):
     cols[2].metric("Fail", summary.fail_count)
     cols[3].metric("Warn / Error", summary.warning_count + summary.error_count)
 
+    # One markdown element for every result; a call per result meant a frontend render each.
+    blocks = []
     for result in summary.results:
-        color = STATUS_COLORS[result.status]
-        icon = STATUS_ICONS[result.status]
-        with st.container():
-            st.markdown(
-                f"<div style='border-left: 4px solid {color}; padding: 8px 12px; margin: 4px 0;'>"
-                f"<strong>[{icon}]</strong> <strong>{result.test_name}</strong><br/>"
-                f"{result.message}"
-                f"</div>",
-                unsafe_allow_html=True,
-            )
-            if result.details:
-                with st.expander("Details"):
-                    st.json(result.details)
+        color, icon = STATUS_STYLES[result.status]
+        blocks.append(
+            f"<div style='border-left: 4px solid {color}; padding: 8px 12px; margin: 4px 0;'>"
+            f"<strong>[{icon}]</strong> <strong>{result.test_name}</strong><br/>"
+            f"{result.message}"
+            f"</div>"
+        )
+    st.markdown("\n".join(blocks), unsafe_allow_html=True)
+
+    for result in summary.results:
+        if result.details:
+            with st.expander(f"Details — {result.test_name}"):
+                st.json(result.details)
 
 
 def render_plots(system_name, data):
@@ -120,17 +135,19 @@ def main():
     with st.sidebar:
         st.header("Configuration")
 
-        systems = registry.get_systems()
-        if not systems:
+        # List what plugins actually register, not module names: a module may use another
+        # SYSTEM_NAME or register several systems. Plugins import their plotting libraries
+        # lazily, so loading them all up front stays cheap.
+        load_all_systems()
+        system_names = list(registry.get_systems())
+        if not system_names:
             st.warning("No systems registered. Add a system module to diagnostics_framework/systems/.")
             return
 
-        system_names = list(systems.keys())
-        selected = st.selectbox(
-            "Select System",
-            system_names,
-            format_func=lambda s: f"{s} — {systems[s].description}" if systems[s].description else s,
-        )
+        selected = st.selectbox("Select System", system_names)
+        system_info = registry.get_systems()[selected]
+        if system_info.description:
+            st.caption(system_info.description)
 
         st.markdown("---")
         st.subheader("Upload Data")
@@ -153,7 +170,7 @@ def main():
 
         if run_button:
             with st.spinner("Running diagnostics..."):
-                summary = run_diagnostics(selected, data)
+                summary = cached_run_diagnostics(selected, uploaded_file.file_id, data)
             st.session_state["last_summary"] = summary
             st.session_state["last_data"] = data
             st.session_state["last_system"] = selected
@@ -162,10 +179,12 @@ def main():
             tab_results, tab_plots, tab_reports = st.tabs(["Results", "Plots", "Reports"])
             with tab_results:
                 render_results(st.session_state["last_summary"])
-            with tab_plots:
-                render_plots(selected, st.session_state.get("last_data", data))
-            with tab_reports:
-                render_reports(selected, st.session_state.get("last_data", data))
+            # Plots and reports rendered in one rerun share the statistics they derive.
+            with cache_scope():
+                with tab_plots:
+                    render_plots(selected, st.session_state.get("last_data", data))
+                with tab_reports:
+                    render_reports(selected, st.session_state.get("last_data", data))
     else:
         st.info("Upload a data file in the sidebar and click **Run Diagnostics** to begin.")
 
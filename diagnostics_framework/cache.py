@@ -0,0 +1,65 @@
+import contextvars
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+
+class _Scope:
+    """Entries shared by every ``cache_by_data`` function while one scope is open."""
+
+    __slots__ = ("entries", "pending", "lock")
+
+    def __init__(self):
+        self.entries: dict[tuple, tuple[Any, Any]] = {}
+        self.pending: dict[tuple, threading.Event] = {}
+        self.lock = threading.Lock()
+
+
+_active_scope: contextvars.ContextVar[_Scope | None] = contextvars.ContextVar("diagnostics_cache_scope", default=None)
+
+
+@contextmanager
+def cache_scope() -> Iterator[None]:
+    """Share ``cache_by_data`` results between everything run inside the block."""
+    if _active_scope.get() is not None:
+        yield
+        return
+    token = _active_scope.set(_Scope())
+    try:
+        yield
+    finally:
+        _active_scope.reset(token)
+
+
+def cache_by_data(fn: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Decorator that memoizes a single-argument function per data object within a ``cache_scope``."""
+    @functools.wraps(fn)
+    def wrapper(data):
+        scope = _active_scope.get()
+        if scope is None:
+            return fn(data)
+
+        key = (fn, id(data))
+        while True:
+            with scope.lock:
+                entry = scope.entries.get(key)
+                if entry is not None:
+                    return entry[1]
+                in_flight = scope.pending.get(key)
+                if in_flight is None:
+                    in_flight = scope.pending[key] = threading.Event()
+                    break
+            in_flight.wait()
+
+        try:
+            value = fn(data)
+            with scope.lock:
+                scope.entries[key] = (data, value)
+            return value
+        finally:
+            with scope.lock:
+                del scope.pending[key]
+            in_flight.set()
+
+    return wrapper
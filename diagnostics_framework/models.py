@@ -11,7 +11,11 @@ class DiagnosticStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Compact ordinal per status so summaries can tally into a fixed-size list.
+_STATUS_INDEX = {status: i for i, status in enumerate(DiagnosticStatus)}
+
+
+@dataclass(slots=True)
 class DiagnosticResult:
     test_name: str
     status: DiagnosticStatus
@@ -20,52 +24,60 @@ class DiagnosticResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemInfo:
     name: str
     description: str = ""
     version: str = "0.1.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestInfo:
     name: str
     description: str
     fn: Callable
 
 
-@dataclass
+@dataclass(slots=True)
 class PlotInfo:
     name: str
     description: str
     fn: Callable
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportInfo:
     name: str
     description: str
     fn: Callable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DiagnosticSummary:
     system_name: str
     results: list[DiagnosticResult]
     timestamp: datetime = field(default_factory=datetime.now)
+    _counts: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Summaries are frozen once built, so tally every status in one pass up front.
+        counts = [0] * len(_STATUS_INDEX)
+        for r in self.results:
+            counts[_STATUS_INDEX[r.status]] += 1
+        object.__setattr__(self, "_counts", tuple(counts))
 
     @property
     def pass_count(self) -> int:
-        return sum(1 for r in self.results if r.status == DiagnosticStatus.PASS)
+        return self._counts[_STATUS_INDEX[DiagnosticStatus.PASS]]
 
     @property
     def fail_count(self) -> int:
-        return sum(1 for r in self.results if r.status == DiagnosticStatus.FAIL)
+        return self._counts[_STATUS_INDEX[DiagnosticStatus.FAIL]]
 
     @property
     def warning_count(self) -> int:
-        return sum(1 for r in self.results if r.status == DiagnosticStatus.WARNING)
+        return self._counts[_STATUS_INDEX[DiagnosticStatus.WARNING]]
 
     @property
     def error_count(self) -> int:
-        return sum(1 for r in self.results if r.status == DiagnosticStatus.ERROR)
+        return self._counts[_STATUS_INDEX[DiagnosticStatus.ERROR]]
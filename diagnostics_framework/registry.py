@@ -1,8 +1,16 @@
-from diagnostics_framework.models import SystemInfo, TestInfo, PlotInfo, ReportInfo
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from diagnostics_framework.models import DiagnosticResult, SystemInfo, TestInfo, PlotInfo, ReportInfo
 
 
 class DiagnosticsRegistry:
-    """Singleton registry for systems, tests, plots, and reports."""
+    """Singleton registry for systems, tests, plots, and reports.
+
+    Getters run on every Streamlit rerun, so they return read-only views (a mapping proxy
+    and tuples) instead of fresh copies.
+    """
 
     _instance = None
 
@@ -10,37 +18,49 @@ class DiagnosticsRegistry:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._systems = {}
+            cls._instance._systems_view = MappingProxyType(cls._instance._systems)
             cls._instance._tests = {}
             cls._instance._plots = {}
             cls._instance._reports = {}
+            cls._instance._plot_index = {}
+            cls._instance._report_index = {}
         return cls._instance
 
     def add_system(self, name: str, description: str = "", version: str = "0.1.0"):
         self._systems[name] = SystemInfo(name=name, description=description, version=version)
-        self._tests.setdefault(name, [])
-        self._plots.setdefault(name, [])
-        self._reports.setdefault(name, [])
+        self._tests.setdefault(name, ())
+        self._plots.setdefault(name, ())
+        self._reports.setdefault(name, ())
 
     def add_test(self, system: str, test_info: TestInfo):
-        self._tests.setdefault(system, []).append(test_info)
+        self._tests[system] = self._tests.get(system, ()) + (test_info,)
 
     def add_plot(self, system: str, plot_info: PlotInfo):
-        self._plots.setdefault(system, []).append(plot_info)
+        self._plots[system] = self._plots.get(system, ()) + (plot_info,)
+        # First registration wins, matching the old first-match scan in the runner.
+        self._plot_index.setdefault(system, {}).setdefault(plot_info.name, plot_info)
 
     def add_report(self, system: str, report_info: ReportInfo):
-        self._reports.setdefault(system, []).append(report_info)
+        self._reports[system] = self._reports.get(system, ()) + (report_info,)
+        self._report_index.setdefault(system, {}).setdefault(report_info.name, report_info)
+
+    def get_systems(self) -> Mapping[str, SystemInfo]:
+        return self._systems_view
 
-    def get_systems(self) -> dict[str, SystemInfo]:
-        return dict(self._systems)
+    def get_tests(self, system: str) -> tuple[TestInfo, ...]:
+        return self._tests.get(system, ())
 
-    def get_tests(self, system: str) -> list[TestInfo]:
-        return list(self._tests.get(system, []))
+    def get_plots(self, system: str) -> tuple[PlotInfo, ...]:
+        return self._plots.get(system, ())
 
-    def get_plots(self, system: str) -> list[PlotInfo]:
-        return list(self._plots.get(system, []))
+    def get_plot(self, system: str, name: str) -> PlotInfo | None:
+        return self._plot_index.get(system, {}).get(name)
 
-    def get_reports(self, system: str) -> list[ReportInfo]:
-        return list(self._reports.get(system, []))
+    def get_reports(self, system: str) -> tuple[ReportInfo, ...]:
+        return self._reports.get(system, ())
+
+    def get_report(self, system: str, name: str) -> ReportInfo | None:
+        return self._report_index.get(system, {}).get(name)
 
 
 # Module-level singleton
@@ -55,10 +75,30 @@ def register_system(name: str, description: str = "", version: str = "0.1.0"):
     return decorator
 
 
+class InvalidResultError(TypeError):
+    """Raised by a registered test that returned something other than a DiagnosticResult."""
+
+
+def _check_returns_result(fn, name: str):
+    """Wrap a test so returning anything but a DiagnosticResult raises instead of passing silently."""
+    @functools.wraps(fn)
+    def wrapper(data):
+        result = fn(data)
+        if not isinstance(result, DiagnosticResult):
+            raise InvalidResultError(f"Test '{name}' did not return a DiagnosticResult.")
+        return result
+    return wrapper
+
+
 def register_test(system: str, name: str, description: str = ""):
-    """Decorator that registers a diagnostic test function for a system."""
+    """Decorator that registers a diagnostic test function for a system.
+
+    Tests must return a DiagnosticResult. The return type is checked in normal runs and
+    trusted under ``python -O``, where the runner calls the test directly.
+    """
     def decorator(fn):
-        registry.add_test(system, TestInfo(name=name, description=description, fn=fn))
+        test_fn = _check_returns_result(fn, name) if __debug__ else fn
+        registry.add_test(system, TestInfo(name=name, description=description, fn=test_fn))
         return fn
     return decorator
 
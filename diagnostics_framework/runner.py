@@ -1,36 +1,78 @@
+from __future__ import annotations
+
+import contextvars
+import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from diagnostics_framework.cache import cache_scope
+from diagnostics_framework.models import DiagnosticResult, DiagnosticStatus, DiagnosticSummary, TestInfo
+from diagnostics_framework.registry import InvalidResultError, registry
+from diagnostics_framework.systems import load_system
+
+if TYPE_CHECKING:
+    import matplotlib.figure
+
+
+class LazyTraceback:
+    """Traceback of a failed test, formatted only when first converted to a string."""
+
+    __slots__ = ("_exc", "_text")
 
-import matplotlib.figure
+    def __init__(self, exc: BaseException):
+        self._exc = traceback.TracebackException.from_exception(exc, lookup_lines=False)
+        self._text = None
 
-from diagnostics_framework.models import DiagnosticResult, DiagnosticStatus, DiagnosticSummary
-from diagnostics_framework.registry import registry
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = "".join(self._exc.format())
+            self._exc = None
+        return self._text
 
+    __repr__ = __str__
 
-def run_diagnostics(system_name: str, data: Any) -> DiagnosticSummary:
-    """Run all registered diagnostic tests for a system against the provided data."""
+
+def _run_test(test_info: TestInfo, data: Any) -> DiagnosticResult:
+    """Run one test, turning any exception into an ERROR result."""
+    try:
+        # register_test validates the return type outside of -O runs.
+        return test_info.fn(data)
+    except InvalidResultError as e:
+        # A wrong return type is the test's contract, not a crash, so no traceback is attached.
+        return DiagnosticResult(test_name=test_info.name, status=DiagnosticStatus.ERROR, message=str(e))
+    except Exception as e:
+        return DiagnosticResult(
+            test_name=test_info.name,
+            status=DiagnosticStatus.ERROR,
+            message=f"Test raised an exception: {e}",
+            details={"exception_type": type(e).__name__, "traceback": LazyTraceback(e)},
+        )
+
+
+def run_diagnostics(system_name: str, data: Any, max_workers: int | None = 1) -> DiagnosticSummary:
+    """Run all registered diagnostic tests for a system against the provided data.
+
+    Tests run one after another by default. Pass ``max_workers > 1`` (or ``None`` for one
+    worker per CPU) to run them on a thread pool instead, only for systems whose tests are
+    thread-safe; results keep registration order either way.
+    """
+    load_system(system_name)
     tests = registry.get_tests(system_name)
-    results = []
-
-    for test_info in tests:
-        try:
-            result = test_info.fn(data)
-            if isinstance(result, DiagnosticResult):
-                results.append(result)
-            else:
-                results.append(DiagnosticResult(
-                    test_name=test_info.name,
-                    status=DiagnosticStatus.ERROR,
-                    message=f"Test '{test_info.name}' did not return a DiagnosticResult.",
-                ))
-        except Exception as e:
-            results.append(DiagnosticResult(
-                test_name=test_info.name,
-                status=DiagnosticStatus.ERROR,
-                message=f"Test raised an exception: {e}",
-                details={"traceback": traceback.format_exc()},
-            ))
+    workers = min(len(tests), max_workers or os.cpu_count() or 1)
+
+    with cache_scope():
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Each worker runs in a copy of this context so it shares the cache scope.
+                futures = [
+                    executor.submit(contextvars.copy_context().run, _run_test, test_info, data)
+                    for test_info in tests
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [_run_test(test_info, data) for test_info in tests]
 
     return DiagnosticSummary(
         system_name=system_name,
@@ -41,17 +83,19 @@ def run_diagnostics(system_name: str, data: Any) -> DiagnosticSummary:
 
 def generate_plot(system_name: str, plot_name: str, data: Any) -> matplotlib.figure.Figure:
     """Generate a plot by name for a system. Returns a matplotlib Figure."""
-    plots = registry.get_plots(system_name)
-    for plot_info in plots:
-        if plot_info.name == plot_name:
-            return plot_info.fn(data)
-    raise ValueError(f"Plot '{plot_name}' not found for system '{system_name}'.")
+    load_system(system_name)
+    plot_info = registry.get_plot(system_name, plot_name)
+    if plot_info is None:
+        raise ValueError(f"Plot '{plot_name}' not found for system '{system_name}'.")
+    with cache_scope():
+        return plot_info.fn(data)
 
 
 def generate_report(system_name: str, report_name: str, data: Any) -> str:
     """Generate a report by name for a system. Returns a string (plain text or markdown)."""
-    reports = registry.get_reports(system_name)
-    for report_info in reports:
-        if report_info.name == report_name:
-            return report_info.fn(data)
-    raise ValueError(f"Report '{report_name}' not found for system '{system_name}'.")
+    load_system(system_name)
+    report_info = registry.get_report(system_name, report_name)
+    if report_info is None:
+        raise ValueError(f"Report '{report_name}' not found for system '{system_name}'.")
+    with cache_scope():
+        return report_info.fn(data)
@@ -1,9 +1,25 @@
-"""Auto-discover and import all system modules so their decorators register on import."""
+"""Discover system modules by name and import them on demand so their decorators register."""
 import importlib
 import pkgutil
 from pathlib import Path
 
 _package_dir = Path(__file__).parent
 
-for _finder, _name, _ispkg in pkgutil.iter_modules([str(_package_dir)]):
-    importlib.import_module(f"{__name__}.{_name}")
+_AVAILABLE = {
+    _name: f"{__name__}.{_name}"
+    for _finder, _name, _ispkg in pkgutil.iter_modules([str(_package_dir)])
+}
+
+
+def load_system(name: str) -> None:
+    """Import the module for a system, or every module when no file matches ``name``."""
+    if name in _AVAILABLE:
+        importlib.import_module(_AVAILABLE[name])
+    else:
+        load_all_systems()
+
+
+def load_all_systems() -> None:
+    """Import every system module in this package."""
+    for module_name in _AVAILABLE.values():
+        importlib.import_module(module_name)
@@ -4,14 +4,20 @@ Generic Example System
 A template system demonstrating the diagnostics framework plugin pattern.
 Copy this file and modify it to create diagnostics for your own system.
 """
-import matplotlib.pyplot as plt
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import numpy as np
 import pandas as pd
-import seaborn as sns
 
+from diagnostics_framework.cache import cache_by_data
 from diagnostics_framework.models import DiagnosticResult, DiagnosticStatus
 from diagnostics_framework.registry import register_system, register_test, register_plot, register_report
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 SYSTEM_NAME = "generic_example"
 
 
@@ -20,6 +26,23 @@ class GenericExampleSystem:
     pass
 
 
+@cache_by_data
+def _null_counts(data: pd.DataFrame) -> pd.Series:
+    """Per-column null counts, shared by the null check and the summary report."""
+    counts = np.zeros(data.shape[1], dtype=np.int64)
+    for i, dtype in enumerate(data.dtypes):
+        # NumPy int, uint, and bool columns cannot hold NaN, so only the others are scanned.
+        if not (isinstance(dtype, np.dtype) and dtype.kind in "iub"):
+            counts[i] = data.iloc[:, i].isna().sum()
+    return pd.Series(counts, index=data.columns)
+
+
+@cache_by_data
+def _numeric_columns(data: pd.DataFrame) -> tuple:
+    """Names of the numeric columns, shared by the range check, overview plot, and report."""
+    return tuple(data.select_dtypes(include="number").columns)
+
+
 # ---------------------------------------------------------------------------
 # Diagnostic Tests
 # ---------------------------------------------------------------------------
@@ -59,9 +82,10 @@ def check_no_nulls(data) -> DiagnosticResult:
             message="Null check only supported for DataFrame input. Skipped.",
         )
 
-    null_counts = data.isnull().sum()
+    null_counts = _null_counts(data)
     total_nulls = int(null_counts.sum())
-    cols_with_nulls = {col: int(count) for col, count in null_counts.items() if count > 0}
+    nonzero = null_counts[null_counts > 0]
+    cols_with_nulls = dict(zip(nonzero.index.tolist(), nonzero.tolist()))
 
     if total_nulls == 0:
         return DiagnosticResult(
@@ -87,7 +111,7 @@ def check_numeric_ranges(data) -> DiagnosticResult:
             message="Range check only supported for DataFrame input. Skipped.",
         )
 
-    numeric_cols = data.select_dtypes(include="number").columns.tolist()
+    numeric_cols = _numeric_columns(data)
     if not numeric_cols:
         return DiagnosticResult(
             test_name="check_numeric_ranges",
@@ -95,11 +119,14 @@ def check_numeric_ranges(data) -> DiagnosticResult:
             message="No numeric columns found to check.",
         )
 
+    # Only float columns can hold inf, and NaN is never inf, so one reduction over the
+    # float block replaces a dropna/isinf/sum round trip per column.
+    float_cols = [col for col in numeric_cols if data[col].dtype.kind == "f"]
     issues = {}
-    for col in numeric_cols:
-        inf_count = int(np.isinf(data[col].dropna()).sum())
-        if inf_count > 0:
-            issues[col] = {"infinite_values": inf_count}
+    if float_cols:
+        block = data[float_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        inf_counts = np.count_nonzero(np.isinf(block), axis=0)
+        issues = {col: {"infinite_values": int(n)} for col, n in zip(float_cols, inf_counts) if n > 0}
 
     if issues:
         return DiagnosticResult(
@@ -113,7 +140,7 @@ def check_numeric_ranges(data) -> DiagnosticResult:
         test_name="check_numeric_ranges",
         status=DiagnosticStatus.PASS,
         message=f"All {len(numeric_cols)} numeric column(s) have finite values.",
-        details={"numeric_columns": numeric_cols},
+        details={"numeric_columns": list(numeric_cols)},
     )
 
 
@@ -123,21 +150,27 @@ def check_numeric_ranges(data) -> DiagnosticResult:
 
 @register_plot(SYSTEM_NAME, name="data_overview", description="Overview histogram of numeric columns")
 def data_overview_plot(data) -> plt.Figure:
+    import matplotlib.pyplot as plt
+
     if not isinstance(data, pd.DataFrame):
         fig, ax = plt.subplots()
         ax.text(0.5, 0.5, "Plot requires DataFrame input", ha="center", va="center")
         return fig
 
-    numeric_cols = data.select_dtypes(include="number").columns.tolist()
+    numeric_cols = _numeric_columns(data)
     if not numeric_cols:
         fig, ax = plt.subplots()
         ax.text(0.5, 0.5, "No numeric columns to plot", ha="center", va="center")
         return fig
 
     n_cols = len(numeric_cols)
+    block = data[list(numeric_cols)].to_numpy(dtype=np.float64, na_value=np.nan)
     fig, axes = plt.subplots(1, n_cols, figsize=(4 * n_cols, 4), squeeze=False)
     for i, col in enumerate(numeric_cols):
-        axes[0][i].hist(data[col].dropna(), bins=20, edgecolor="black", alpha=0.7)
+        # Bin in NumPy and draw the bars directly, skipping the dropna copy and ax.hist's own pass.
+        values = block[:, i]
+        counts, edges = np.histogram(values[np.isfinite(values)], bins=20)
+        axes[0][i].bar(edges[:-1], counts, width=np.diff(edges), align="edge", edgecolor="black", alpha=0.7)
         axes[0][i].set_title(col)
         axes[0][i].set_xlabel("Value")
         axes[0][i].set_ylabel("Count")
@@ -148,13 +181,18 @@ def data_overview_plot(data) -> plt.Figure:
 
 @register_plot(SYSTEM_NAME, name="null_heatmap", description="Heatmap showing location of null values")
 def null_heatmap(data) -> plt.Figure:
+    import matplotlib.pyplot as plt
+
     if not isinstance(data, pd.DataFrame):
         fig, ax = plt.subplots()
         ax.text(0.5, 0.5, "Plot requires DataFrame input", ha="center", va="center")
         return fig
 
     fig, ax = plt.subplots(figsize=(max(6, len(data.columns)), max(4, len(data) * 0.05)))
-    sns.heatmap(data.isnull().astype(int), cbar=False, cmap="YlOrRd", ax=ax, yticklabels=False)
+    # imshow blits the 1-byte bool mask directly; seaborn built an int64 frame and a mesh cell per value.
+    ax.imshow(data.isna().to_numpy(), aspect="auto", cmap="YlOrRd", interpolation="nearest", vmin=0, vmax=1)
+    ax.set_xticks(range(len(data.columns)), labels=data.columns, rotation=90)
+    ax.set_yticks([])
     ax.set_title("Null Values (yellow = present, red = null)")
     fig.tight_layout()
     return fig
@@ -177,25 +215,30 @@ def summary_report(data) -> str:
         "",
         "## Column Types",
     ]
-    for col in data.columns:
-        lines.append(f"- **{col}**: {data[col].dtype}")
+    # Work from frame-level Series (dtypes, null counts, one agg) rather than building a
+    # column Series per line; on wide frames that per-column construction dominated.
+    lines.extend(f"- **{col}**: {dtype}" for col, dtype in data.dtypes.items())
 
     lines.append("")
     lines.append("## Null Counts")
-    null_counts = data.isnull().sum()
-    for col, count in null_counts.items():
-        if count > 0:
-            lines.append(f"- **{col}**: {count} nulls ({count / len(data) * 100:.1f}%)")
-    if null_counts.sum() == 0:
+    null_counts = _null_counts(data)
+    nonzero = null_counts[null_counts > 0]
+    percents = nonzero / len(data) * 100
+    lines.extend(
+        f"- **{col}**: {count} nulls ({pct:.1f}%)"
+        for col, count, pct in zip(nonzero.index, nonzero.tolist(), percents.tolist())
+    )
+    if nonzero.empty:
         lines.append("- No null values found.")
 
-    numeric_cols = data.select_dtypes(include="number")
-    if not numeric_cols.empty:
+    numeric_cols = _numeric_columns(data)
+    if numeric_cols and not data.empty:
         lines.append("")
         lines.append("## Numeric Summary")
-        for col in numeric_cols.columns:
-            series = numeric_cols[col].dropna()
-            lines.append(f"- **{col}**: min={series.min():.4g}, max={series.max():.4g}, "
-                         f"mean={series.mean():.4g}, std={series.std():.4g}")
+        stats = data[list(numeric_cols)].agg(["min", "max", "mean", "std"])
+        lines.extend(
+            f"- **{col}**: min={lo:.4g}, max={hi:.4g}, mean={mean:.4g}, std={std:.4g}"
+            for col, (lo, hi, mean, std) in zip(numeric_cols, stats.T.itertuples(index=False))
+        )
 
     return "\n".join(lines)
@@ -4,22 +4,172 @@ Sensor Monitoring System
 Diagnostics for IoT/environmental sensor data with time series,
 battery health, and anomaly detection checks.
 """
-import matplotlib.pyplot as plt
+from __future__ import annotations
+
+import io
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 import numpy as np
 import pandas as pd
-import seaborn as sns
 
+from diagnostics_framework.cache import cache_by_data
 from diagnostics_framework.models import DiagnosticResult, DiagnosticStatus
 from diagnostics_framework.registry import register_system, register_test, register_plot, register_report
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 SYSTEM_NAME = "sensor_monitoring"
 
+TEMPERATURE_RANGE = (-10.0, 50.0)
+BATTERY_LOW = 20.0
+BATTERY_CRITICAL = 10.0
+
 
 @register_system(SYSTEM_NAME, description="IoT sensor monitoring diagnostics", version="0.1.0")
 class SensorMonitoringSystem:
     pass
 
 
+# Upper bounds on how much data the plots draw: points per sensor line and rows fed to corr().
+_PLOT_POINTS_PER_LINE = 2000
+_CORRELATION_SAMPLE_ROWS = 50_000
+
+
+def _count_missing(series: pd.Series) -> int:
+    """Number of missing values in one column."""
+    if isinstance(series.dtype, np.dtype):
+        if series.dtype.kind in "iub":
+            return 0
+        if series.dtype.kind == "f":
+            return int(np.count_nonzero(np.isnan(series.to_numpy())))
+    return int(series.isna().sum())
+
+
+def _float_values(series: pd.Series) -> np.ndarray:
+    """The series as a float ndarray with NaN for missing values."""
+    dtype = np.float32 if series.dtype == np.float32 else np.float64
+    return series.to_numpy(dtype=dtype, na_value=np.nan)
+
+
+def _codes(series: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """Integer codes (-1 for missing) and the labels they index, sorted for non-categoricals."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    return pd.factorize(series, sort=True)
+
+
+@cache_by_data
+def _timestamps(data: pd.DataFrame) -> np.ndarray:
+    """The ``timestamp`` column parsed to datetime64, shared by the time-series plots."""
+    timestamps = data["timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps, errors="coerce", cache=True)
+    return timestamps.to_numpy()
+
+
+@dataclass(frozen=True)
+class _TemperatureStats:
+    count: int
+    min: float
+    max: float
+    mean: float
+    std: float
+    out_of_range: int
+
+
+class _SensorStats:
+    """Statistics shared by the sensor checks and the health report, computed on first use."""
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+
+    @cached_property
+    def null_counts(self) -> pd.Series:
+        return pd.Series(
+            [_count_missing(self.data.iloc[:, i]) for i in range(self.data.shape[1])],
+            index=self.data.columns,
+            dtype=np.int64,
+        )
+
+    @cached_property
+    def _sensor_codes(self) -> tuple[np.ndarray, pd.Index]:
+        return _codes(self.data["sensor_id"])
+
+    @cached_property
+    def sensor_ids(self) -> list:
+        """Distinct sensor ids in sorted order, excluding missing ids."""
+        codes, labels = self._sensor_codes
+        ids = labels[np.bincount(codes[codes >= 0], minlength=len(labels)) > 0]
+        return ids.tolist() if ids.is_monotonic_increasing else sorted(ids)
+
+    @cached_property
+    def latest_battery(self) -> pd.Series:
+        """Last reported battery level per sensor; NaN for sensors that never reported one."""
+        codes, labels = self._sensor_codes
+        battery = _float_values(self.data["battery_level"])
+        n_categories = len(labels)
+        rows = np.flatnonzero((codes >= 0) & ~np.isnan(battery))
+        last_row = np.full(n_categories, -1, dtype=np.int64)
+        np.maximum.at(last_row, codes[rows], rows)
+
+        observed = np.bincount(codes[codes >= 0], minlength=n_categories) > 0
+        levels = np.full(n_categories, np.nan)
+        hit = last_row >= 0
+        levels[hit] = battery[last_row[hit]]
+        return pd.Series(
+            levels[observed],
+            index=pd.Index(labels[observed], name="sensor_id"),
+            name="battery_level",
+        )
+
+    @cached_property
+    def temperature(self) -> _TemperatureStats:
+        temp = _float_values(self.data["temperature"])
+        nan_mask = np.isnan(temp)
+        n_missing = np.count_nonzero(nan_mask)
+        if n_missing == temp.size:
+            return _TemperatureStats(0, np.nan, np.nan, np.nan, np.nan, 0)
+        if n_missing:
+            temp = temp[~nan_mask]
+        low, high = TEMPERATURE_RANGE
+        t_min, t_max = float(temp.min()), float(temp.max())
+        out_of_range = 0
+        if t_min < low:
+            out_of_range += np.count_nonzero(temp < low)
+        if t_max > high:
+            out_of_range += np.count_nonzero(temp > high)
+        return _TemperatureStats(
+            count=int(temp.size),
+            min=t_min,
+            max=t_max,
+            mean=float(temp.mean(dtype=np.float64)),
+            std=float(temp.std(ddof=1, dtype=np.float64)) if temp.size > 1 else np.nan,
+            out_of_range=int(out_of_range),
+        )
+
+    @cached_property
+    def status_counts(self) -> dict:
+        """Readings per status, most common first, as ``value_counts()`` would order them."""
+        codes, labels = _codes(self.data["status"])
+        n_categories = len(labels)
+        rows = np.flatnonzero(codes >= 0)
+        counts = np.bincount(codes[rows], minlength=n_categories)
+        first_row = np.full(n_categories, len(codes), dtype=np.int64)
+        np.minimum.at(first_row, codes[rows], rows)
+        order = np.lexsort((first_row, -counts))
+        order = order[counts[order] > 0]
+        return dict(zip(labels[order].tolist(), counts[order].tolist()))
+
+
+@cache_by_data
+def _sensor_stats(data: pd.DataFrame) -> _SensorStats:
+    return _SensorStats(data)
+
+
 # ---------------------------------------------------------------------------
 # Diagnostic Tests
 # ---------------------------------------------------------------------------
@@ -45,11 +195,12 @@ def check_missing_readings(data) -> DiagnosticResult:
     if not isinstance(data, pd.DataFrame):
         return DiagnosticResult(test_name="check_missing_readings", status=DiagnosticStatus.WARNING, message="Skipped: not a DataFrame.")
 
-    null_counts = data.isnull().sum()
+    null_counts = _sensor_stats(data).null_counts
     total_nulls = int(null_counts.sum())
     total_cells = int(data.size)
     pct = total_nulls / total_cells * 100 if total_cells > 0 else 0
-    cols_with_nulls = {col: int(c) for col, c in null_counts.items() if c > 0}
+    nonzero = null_counts[null_counts > 0]
+    cols_with_nulls = dict(zip(nonzero.index.tolist(), nonzero.tolist()))
 
     if total_nulls == 0:
         return DiagnosticResult(test_name="check_missing_readings", status=DiagnosticStatus.PASS, message="No missing readings.")
@@ -68,16 +219,19 @@ def check_battery_health(data) -> DiagnosticResult:
     if not isinstance(data, pd.DataFrame) or "battery_level" not in data.columns:
         return DiagnosticResult(test_name="check_battery_health", status=DiagnosticStatus.WARNING, message="No battery_level column found.")
 
-    low_threshold = 20.0
-    critical_threshold = 10.0
-    battery = data[["sensor_id", "battery_level"]].dropna() if "sensor_id" in data.columns else data[["battery_level"]].dropna()
+    low_threshold = BATTERY_LOW
+    critical_threshold = BATTERY_CRITICAL
 
     if "sensor_id" in data.columns:
-        latest = battery.groupby("sensor_id")["battery_level"].last()
-        critical = latest[latest < critical_threshold].to_dict()
-        low = latest[(latest >= critical_threshold) & (latest < low_threshold)].to_dict()
+        latest = _sensor_stats(data).latest_battery.dropna()
+        if latest.empty or latest.min() >= low_threshold:
+            # Healthy fleets skip building both threshold masks.
+            critical, low = {}, {}
+        else:
+            critical = latest[latest < critical_threshold].to_dict()
+            low = latest[(latest >= critical_threshold) & (latest < low_threshold)].to_dict()
     else:
-        last_val = float(battery["battery_level"].iloc[-1])
+        last_val = float(data["battery_level"].dropna().iloc[-1])
         critical = {"unknown": last_val} if last_val < critical_threshold else {}
         low = {"unknown": last_val} if critical_threshold <= last_val < low_threshold else {}
 
@@ -107,22 +261,21 @@ def check_temperature_range(data) -> DiagnosticResult:
     if not isinstance(data, pd.DataFrame) or "temperature" not in data.columns:
         return DiagnosticResult(test_name="check_temperature_range", status=DiagnosticStatus.WARNING, message="No temperature column found.")
 
-    temp = data["temperature"].dropna()
-    min_expected, max_expected = -10.0, 50.0
-    out_of_range = temp[(temp < min_expected) | (temp > max_expected)]
+    temp = _sensor_stats(data).temperature
+    min_expected, max_expected = TEMPERATURE_RANGE
 
-    if len(out_of_range) > 0:
+    if temp.out_of_range > 0:
         return DiagnosticResult(
             test_name="check_temperature_range",
             status=DiagnosticStatus.FAIL,
-            message=f"{len(out_of_range)} readings outside expected range [{min_expected}, {max_expected}].",
-            details={"out_of_range_count": len(out_of_range), "min_observed": float(temp.min()), "max_observed": float(temp.max())},
+            message=f"{temp.out_of_range} readings outside expected range [{min_expected}, {max_expected}].",
+            details={"out_of_range_count": temp.out_of_range, "min_observed": temp.min, "max_observed": temp.max},
         )
     return DiagnosticResult(
         test_name="check_temperature_range",
         status=DiagnosticStatus.PASS,
-        message=f"All {len(temp)} temperature readings within [{min_expected}, {max_expected}]. Range: {temp.min():.1f} to {temp.max():.1f}.",
-        details={"min": float(temp.min()), "max": float(temp.max()), "mean": float(temp.mean())},
+        message=f"All {temp.count} temperature readings within [{min_expected}, {max_expected}]. Range: {temp.min:.1f} to {temp.max:.1f}.",
+        details={"min": temp.min, "max": temp.max, "mean": temp.mean},
     )
 
 
@@ -131,7 +284,7 @@ def check_sensor_status(data) -> DiagnosticResult:
     if not isinstance(data, pd.DataFrame) or "status" not in data.columns:
         return DiagnosticResult(test_name="check_sensor_status", status=DiagnosticStatus.WARNING, message="No status column found.")
 
-    status_counts = data["status"].value_counts().to_dict()
+    status_counts = _sensor_stats(data).status_counts
     critical_count = status_counts.get("critical", 0)
     warning_count = status_counts.get("warning", 0)
 
@@ -161,8 +314,42 @@ def check_sensor_status(data) -> DiagnosticResult:
 # Plots
 # ---------------------------------------------------------------------------
 
+def _downsample(x: np.ndarray, y: np.ndarray, target: int = _PLOT_POINTS_PER_LINE) -> tuple[np.ndarray, np.ndarray]:
+    """Keep every ``stride``-th point so a line has at most about ``target`` points."""
+    stride = max(1, len(y) // target)
+    return x[::stride], y[::stride]
+
+
+@cache_by_data
+def _sensor_rows(data: pd.DataFrame) -> list[tuple]:
+    """``(sensor_id, row positions)`` per sensor, in the order ``groupby`` would give."""
+    codes, labels = _codes(data["sensor_id"])
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(labels) + 1))
+    return [
+        (labels[i], order[bounds[i]:bounds[i + 1]])
+        for i in range(len(labels))
+        if bounds[i] < bounds[i + 1]
+    ]
+
+
+def _plot_by_sensor(ax, data: pd.DataFrame, column: str) -> None:
+    """Draw ``column`` over time with one line per sensor, in a single ax.plot call."""
+    timestamps = _timestamps(data)
+    values = data[column].to_numpy()
+    args, labels = [], []
+    for sensor_id, rows in _sensor_rows(data):
+        args += _downsample(timestamps[rows], values[rows])
+        labels.append(sensor_id)
+    lines = ax.plot(*args, marker="o", markersize=3) if args else []
+    for line, label in zip(lines, labels):
+        line.set_label(label)
+
+
 @register_plot(SYSTEM_NAME, name="temperature_timeseries", description="Temperature over time per sensor")
 def temperature_timeseries(data) -> plt.Figure:
+    import matplotlib.pyplot as plt
+
     if not isinstance(data, pd.DataFrame) or "temperature" not in data.columns:
         fig, ax = plt.subplots()
         ax.text(0.5, 0.5, "Requires 'temperature' column", ha="center", va="center")
@@ -170,9 +357,7 @@ def temperature_timeseries(data) -> plt.Figure:
 
     fig, ax = plt.subplots(figsize=(12, 5))
     if "sensor_id" in data.columns and "timestamp" in data.columns:
-        for sensor_id, group in data.groupby("sensor_id"):
-            ts = pd.to_datetime(group["timestamp"], errors="coerce")
-            ax.plot(ts, group["temperature"], marker="o", markersize=3, label=sensor_id)
+        _plot_by_sensor(ax, data, "temperature")
         ax.legend(title="Sensor")
         ax.set_xlabel("Time")
     else:
@@ -188,6 +373,8 @@ def temperature_timeseries(data) -> plt.Figure:
 
 @register_plot(SYSTEM_NAME, name="battery_levels", description="Battery level per sensor over time")
 def battery_levels(data) -> plt.Figure:
+    import matplotlib.pyplot as plt
+
     if not isinstance(data, pd.DataFrame) or "battery_level" not in data.columns:
         fig, ax = plt.subplots()
         ax.text(0.5, 0.5, "Requires 'battery_level' column", ha="center", va="center")
@@ -195,17 +382,15 @@ def battery_levels(data) -> plt.Figure:
 
     fig, ax = plt.subplots(figsize=(12, 5))
     if "sensor_id" in data.columns and "timestamp" in data.columns:
-        for sensor_id, group in data.groupby("sensor_id"):
-            ts = pd.to_datetime(group["timestamp"], errors="coerce")
-            ax.plot(ts, group["battery_level"], marker="o", markersize=3, label=sensor_id)
+        _plot_by_sensor(ax, data, "battery_level")
         ax.legend(title="Sensor")
         ax.set_xlabel("Time")
     else:
         ax.plot(data.index, data["battery_level"], marker="o", markersize=3)
         ax.set_xlabel("Index")
 
-    ax.axhline(y=20, color="orange", linestyle="--", alpha=0.7, label="Low threshold (20%)")
-    ax.axhline(y=10, color="red", linestyle="--", alpha=0.7, label="Critical threshold (10%)")
+    ax.axhline(y=BATTERY_LOW, color="orange", linestyle="--", alpha=0.7, label=f"Low threshold ({BATTERY_LOW:.0f}%)")
+    ax.axhline(y=BATTERY_CRITICAL, color="red", linestyle="--", alpha=0.7, label=f"Critical threshold ({BATTERY_CRITICAL:.0f}%)")
     ax.set_ylabel("Battery Level (%)")
     ax.set_title("Battery Level Over Time")
     ax.legend(title="Sensor")
@@ -215,21 +400,43 @@ def battery_levels(data) -> plt.Figure:
     return fig
 
 
+def _correlation(data: pd.DataFrame, positions: list[int], rows: np.ndarray | None = None) -> pd.DataFrame:
+    """Pearson correlation of the columns at ``positions``, matching ``DataFrame.corr()``."""
+    columns = data.columns[positions]
+    arrays = [data.iloc[:, i].to_numpy(dtype=np.float64, na_value=np.nan) for i in positions]
+    if rows is not None:
+        arrays = [values[rows] for values in arrays]
+    values = np.column_stack(arrays)
+    if len(values) < 2 or np.isnan(values).any():
+        return pd.DataFrame(values, columns=columns).corr()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.corrcoef(values, rowvar=False)
+    return pd.DataFrame(np.atleast_2d(corr), index=columns, columns=columns)
+
+
 @register_plot(SYSTEM_NAME, name="correlation_heatmap", description="Correlation matrix of numeric columns")
 def correlation_heatmap(data) -> plt.Figure:
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     if not isinstance(data, pd.DataFrame):
         fig, ax = plt.subplots()
         ax.text(0.5, 0.5, "Requires DataFrame input", ha="center", va="center")
         return fig
 
-    numeric = data.select_dtypes(include="number")
-    if numeric.empty:
+    # Integer and float columns (NumPy or nullable); checking dtypes avoids select_dtypes' copy.
+    positions = [i for i, dtype in enumerate(data.dtypes) if dtype.kind in "iuf"]
+    if not positions or data.empty:
         fig, ax = plt.subplots()
         ax.text(0.5, 0.5, "No numeric columns", ha="center", va="center")
         return fig
 
+    rows = None
+    if len(data) > _CORRELATION_SAMPLE_ROWS:
+        rows = np.sort(np.random.default_rng(0).choice(len(data), _CORRELATION_SAMPLE_ROWS, replace=False))
+
     fig, ax = plt.subplots(figsize=(8, 6))
-    corr = numeric.corr()
+    corr = _correlation(data, positions, rows)
     sns.heatmap(corr, annot=True, fmt=".2f", cmap="RdBu_r", center=0, ax=ax, square=True)
     ax.set_title("Correlation Matrix")
     fig.tight_layout()
@@ -238,17 +445,19 @@ def correlation_heatmap(data) -> plt.Figure:
 
 @register_plot(SYSTEM_NAME, name="sensor_status_breakdown", description="Pie chart of sensor status counts")
 def sensor_status_breakdown(data) -> plt.Figure:
+    import matplotlib.pyplot as plt
+
     if not isinstance(data, pd.DataFrame) or "status" not in data.columns:
         fig, ax = plt.subplots()
         ax.text(0.5, 0.5, "Requires 'status' column", ha="center", va="center")
         return fig
 
-    status_counts = data["status"].value_counts()
+    status_counts = _sensor_stats(data).status_counts
     colors = {"active": "#28a745", "warning": "#ffc107", "critical": "#dc3545", "inactive": "#6c757d"}
-    pie_colors = [colors.get(s, "#999999") for s in status_counts.index]
+    pie_colors = [colors.get(s, "#999999") for s in status_counts]
 
     fig, ax = plt.subplots(figsize=(6, 6))
-    ax.pie(status_counts.values, labels=status_counts.index, autopct="%1.0f%%", colors=pie_colors, startangle=90)
+    ax.pie(list(status_counts.values()), labels=list(status_counts), autopct="%1.0f%%", colors=pie_colors, startangle=90)
     ax.set_title("Sensor Status Breakdown")
     fig.tight_layout()
     return fig
@@ -258,64 +467,92 @@ def sensor_status_breakdown(data) -> plt.Figure:
 # Reports
 # ---------------------------------------------------------------------------
 
-@register_report(SYSTEM_NAME, name="sensor_health_report", description="Full health report across all sensors")
-def sensor_health_report(data) -> str:
+def _health_report_lines(data) -> Iterator[str]:
     if not isinstance(data, pd.DataFrame):
-        return "Report requires DataFrame input."
+        yield "Report requires DataFrame input."
+        return
+
+    yield "# Sensor Health Report"
+    yield ""
 
-    lines = ["# Sensor Health Report", ""]
+    stats = _sensor_stats(data)
 
-    lines.append(f"**Total readings:** {len(data)}")
+    yield f"**Total readings:** {len(data)}"
     if "sensor_id" in data.columns:
-        sensors = data["sensor_id"].nunique()
-        lines.append(f"**Unique sensors:** {sensors}")
-        lines.append(f"**Sensors:** {', '.join(sorted(data['sensor_id'].unique()))}")
-    lines.append("")
+        sensors = stats.sensor_ids
+        yield f"**Unique sensors:** {len(sensors)}"
+        yield f"**Sensors:** {', '.join(sensors)}"
+    yield ""
 
     # Missing data
-    null_counts = data.isnull().sum()
+    null_counts = stats.null_counts
     total_nulls = int(null_counts.sum())
-    lines.append("## Data Completeness")
+    yield "## Data Completeness"
     if total_nulls == 0:
-        lines.append("All readings complete — no missing values.")
+        yield "All readings complete — no missing values."
     else:
-        lines.append(f"**{total_nulls} missing values** detected:")
-        for col, count in null_counts.items():
-            if count > 0:
-                lines.append(f"- {col}: {count} missing ({count / len(data) * 100:.1f}%)")
-    lines.append("")
+        yield f"**{total_nulls} missing values** detected:"
+        nonzero = null_counts[null_counts > 0]
+        yield from (
+            f"- {col}: {count} missing ({count / len(data) * 100:.1f}%)"
+            for col, count in zip(nonzero.index, nonzero.tolist())
+        )
+    yield ""
 
     # Battery
     if "battery_level" in data.columns and "sensor_id" in data.columns:
-        lines.append("## Battery Status")
-        latest_battery = data.groupby("sensor_id")["battery_level"].last()
-        for sensor_id, level in latest_battery.items():
-            if pd.isna(level):
-                emoji = "unknown"
-            elif level < 10:
-                emoji = "CRITICAL"
-            elif level < 20:
-                emoji = "LOW"
-            else:
-                emoji = "OK"
-            display_level = f"{level:.1f}%" if not pd.isna(level) else "N/A"
-            lines.append(f"- **{sensor_id}**: {display_level} [{emoji}]")
-        lines.append("")
+        yield "## Battery Status"
+        # Classify every sensor in one np.select instead of an if/elif chain per sensor.
+        latest = stats.latest_battery
+        levels = latest.to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(levels)
+        states = np.select(
+            [missing, levels < BATTERY_CRITICAL, levels < BATTERY_LOW],
+            ["unknown", "CRITICAL", "LOW"],
+            default="OK",
+        )
+        yield from (
+            f"- **{sensor_id}**: {'N/A' if gap else f'{level:.1f}%'} [{state}]"
+            for sensor_id, level, gap, state in zip(latest.index, levels.tolist(), missing.tolist(), states.tolist())
+        )
+        yield ""
 
     # Temperature
     if "temperature" in data.columns:
-        temp = data["temperature"].dropna()
-        lines.append("## Temperature Summary")
-        lines.append(f"- Min: {temp.min():.1f}")
-        lines.append(f"- Max: {temp.max():.1f}")
-        lines.append(f"- Mean: {temp.mean():.1f}")
-        lines.append(f"- Std Dev: {temp.std():.1f}")
-        lines.append("")
+        temp = stats.temperature
+        yield "## Temperature Summary"
+        yield f"- Min: {temp.min:.1f}"
+        yield f"- Max: {temp.max:.1f}"
+        yield f"- Mean: {temp.mean:.1f}"
+        yield f"- Std Dev: {temp.std:.1f}"
+        yield ""
 
     # Status
     if "status" in data.columns:
-        lines.append("## Status Summary")
-        for status, count in data["status"].value_counts().items():
-            lines.append(f"- **{status}**: {count} readings ({count / len(data) * 100:.0f}%)")
+        yield "## Status Summary"
+        status_counts = stats.status_counts
+        percents = np.array(list(status_counts.values()), dtype=np.float64) / len(data) * 100
+        yield from (
+            f"- **{status}**: {count} readings ({pct:.0f}%)"
+            for (status, count), pct in zip(status_counts.items(), percents.tolist())
+        )
 
-    return "\n".join(lines)
+
+def sensor_health_report_iter(data) -> Iterator[str]:
+    """Yield the health report in pieces that join (with ``""``) into ``sensor_health_report``.
+
+    Lets callers stream the report, e.g. to a file or HTTP response, without holding it all.
+    """
+    lines = _health_report_lines(data)
+    yield next(lines)
+    for line in lines:
+        yield "\n" + line
+
+
+@register_report(SYSTEM_NAME, name="sensor_health_report", description="Full health report across all sensors")
+def sensor_health_report(data) -> str:
+    # Appending to one growing buffer avoids keeping every line alive until a final join.
+    buf = io.StringIO()
+    for chunk in sensor_health_report_iter(data):
+        buf.write(chunk)
+    return buf.getvalue()